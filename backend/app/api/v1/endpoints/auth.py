@@ -1,21 +1,57 @@
-from datetime import timedelta
+import uuid
+from datetime import datetime, timedelta
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.encoders import jsonable_encoder
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
+from sqlalchemy.orm import make_transient_to_detached
 
+from app.core.cache import get_redis
 from app.core.database import get_db
 from app.core.security import create_access_token, verify_password, get_password_hash, verify_token
 from app.core.config import settings
-from app.models.user import User
+from app.models.user import User, Role
 from app.schemas.user import UserCreate, UserResponse, UserLogin
 from app.schemas.token import Token
 
 router = APIRouter()
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="api/v1/auth/login")
 
+USER_CACHE_TTL = 60
+# hashed_password stays out of Redis deliberately: nothing on the
+# authenticated path reads it (login always hits the DB), and the
+# re-attached instance never flushes the unloaded column
+USER_CACHE_FIELDS = (
+    "id", "email", "name", "role", "skills", "rating",
+    "wallet_balance", "avatar_url", "tier", "onboarding_completed",
+    "is_active", "created_at", "updated_at"
+)
 
-async def get_current_user(token: str = Depends(oauth2_scheme), db: AsyncSession = Depends(get_db)):
+
+def _user_to_cache(user: User) -> bytes:
+    return orjson.dumps(jsonable_encoder({f: getattr(user, f) for f in USER_CACHE_FIELDS}))
+
+
+def _user_from_cache(raw: bytes) -> User:
+    data = orjson.loads(raw)
+    data["id"] = uuid.UUID(data["id"])
+    for field in ("created_at", "updated_at"):
+        if data.get(field):
+            data[field] = datetime.fromisoformat(data[field])
+    user = User(**data)
+    # Mark the rebuilt instance detached so sessions can re-attach it as
+    # persistent without re-selecting the row
+    make_transient_to_detached(user)
+    return user
+
+
+async def get_current_user(
+    token: str = Depends(oauth2_scheme),
+    db: AsyncSession = Depends(get_db),
+    r = Depends(get_redis)
+):
     payload = verify_token(token)
     email: str = payload.get("sub")
     if email is None:
@@ -23,7 +59,15 @@ async def get_current_user(token: str = Depends(oauth2_scheme), db: AsyncSession
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Could not validate credentials",
         )
-    
+
+    # The auth lookup fronts every request; a short-TTL Redis hit skips the
+    # per-request DB round trip
+    cached = await r.get(f"user:{email}")
+    if cached is not None:
+        user = _user_from_cache(cached)
+        db.add(user)
+        return user
+
     result = await db.execute(select(User).where(User.email == email))
     user = result.scalar_one_or_none()
     if user is None:
@@ -31,6 +75,8 @@ async def get_current_user(token: str = Depends(oauth2_scheme), db: AsyncSession
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="User not found",
         )
+
+    await r.set(f"user:{email}", _user_to_cache(user), ex=USER_CACHE_TTL)
     return user
 
 
@@ -53,7 +99,7 @@ async def register(user_data: UserCreate, db: AsyncSession = Depends(get_db)):
         role=user_data.role,
         skills=user_data.skills or [],
         tier=user_data.tier,
-        wallet_balance=5000.0 if user_data.role == "client" else 0.0
+        wallet_balance=5000.0 if user_data.role == Role.CLIENT else 0.0
     )
     
     db.add(db_user)
@@ -1,41 +1,162 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from typing import List
+from sqlalchemy import delete, insert, lambda_stmt, select, tuple_, update
+from typing import Optional
 
+from app.core.cache import get_redis, cache_get, cache_set, cache_invalidate
 from app.core.database import get_db
+from app.core.pagination import decode_cursor, next_cursor_from
 from app.models.user import User
 from app.models.notification import Notification
-from app.schemas.notification import NotificationResponse
+from app.schemas.notification import NotificationResponse, NotificationListItem, NotificationListResponse
 from app.api.v1.endpoints.auth import get_current_user
 
 router = APIRouter()
 
+# Exactly the columns NotificationListItem serializes; list queries project
+# these instead of hydrating tracked ORM instances, and skip the message
+# Text column entirely. The stream route adds it back for full exports.
+NOTIF_LIST_COLS = (
+    Notification.id,
+    Notification.user_id,
+    Notification.title,
+    Notification.type,
+    Notification.read,
+    Notification.created_at,
+    Notification.updated_at,
+)
+NOTIF_FULL_COLS = NOTIF_LIST_COLS + (Notification.message,)
 
-@router.get("/", response_model=List[NotificationResponse])
+# Module-level adapter so Pydantic's Rust serializer is built once, not per request
+NOTIF_PAGE_ADAPTER = TypeAdapter(NotificationListResponse)
+
+
+async def create_notifications(db: AsyncSession, entries):
+    """Fan out notifications with one multi-row INSERT instead of N single
+    inserts. entries is a list of dicts of Notification column values;
+    the caller commits, then must call publish_notification_changes for the
+    affected user ids so cached pages are invalidated and SSE listeners
+    wake — otherwise recipients see stale lists for the cache TTL."""
+    if not entries:
+        return []
+    result = await db.execute(
+        insert(Notification).values(entries).returning(Notification)
+    )
+    return result.scalars().all()
+
+
+async def publish_notification_changes(r, user_ids, event: str = "created"):
+    """Companion to create_notifications: after the insert is committed,
+    drop each recipient's cached notification pages and publish a change
+    hint on their SSE channel."""
+    for user_id in set(user_ids):
+        await cache_invalidate(r, f"notif:{user_id}:*")
+        await r.publish(
+            f"notifications:{user_id}",
+            orjson.dumps({"event": event})
+        )
+
+
+@router.get("/", response_model=NotificationListResponse)
 async def get_notifications(
-    skip: int = 0,
+    cursor: Optional[str] = None,
     limit: int = 100,
     unread_only: bool = False,
     db: AsyncSession = Depends(get_db),
+    r = Depends(get_redis),
     current_user: User = Depends(get_current_user)
 ):
-    query = select(Notification).where(Notification.user_id == current_user.id)
-    
+    cache_key = f"notif:{current_user.id}:{unread_only}:{cursor}:{limit}"
+    cached = await cache_get(r, cache_key)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+
+    # lambda_stmt caches the compiled SQL keyed by the lambda chain, so
+    # repeat requests skip statement compilation entirely
+    user_id = current_user.id
+    query = lambda_stmt(lambda: select(*NOTIF_LIST_COLS).where(Notification.user_id == user_id))
+
     if unread_only:
-        query = query.where(Notification.read == False)
-    
-    query = query.order_by(Notification.created_at.desc()).offset(skip).limit(limit)
+        query += lambda s: s.where(Notification.read == False)
+
+    if cursor:
+        ts, id_ = decode_cursor(cursor)
+        query += lambda s: s.where(tuple_(Notification.created_at, Notification.id) < tuple_(ts, id_))
+
+    query += lambda s: s.order_by(Notification.created_at.desc(), Notification.id.desc()).limit(limit)
     result = await db.execute(query)
-    notifications = result.scalars().all()
-    
-    return notifications
+    notifications = result.all()
+
+    page = NotificationListResponse(
+        items=[NotificationListItem.model_validate(dict(n._mapping)) for n in notifications],
+        next_cursor=next_cursor_from(notifications, limit)
+    )
+    body = NOTIF_PAGE_ADAPTER.dump_json(page)
+    await cache_set(r, cache_key, body)
+    return Response(content=body, media_type="application/json")
+
+
+@router.get("/stream")
+async def stream_notifications(
+    unread_only: bool = False,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    query = select(*NOTIF_FULL_COLS).where(Notification.user_id == current_user.id)
+
+    if unread_only:
+        query = query.where(Notification.read == False)
+
+    query = query.order_by(Notification.created_at.desc(), Notification.id.desc())
+
+    # Server-side streaming keeps memory at O(partition) instead of O(result)
+    # and starts the response before the full set is fetched
+    async def generate():
+        result = await db.stream(query)
+        async for partition in result.partitions(500):
+            for row in partition:
+                item = NotificationResponse.model_validate(dict(row._mapping))
+                yield orjson.dumps(jsonable_encoder(item)) + b"\n"
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
+
+
+@router.get("/events")
+async def notification_events(
+    r = Depends(get_redis),
+    current_user: User = Depends(get_current_user)
+):
+    channel = f"notifications:{current_user.id}"
+
+    # SSE over Redis pub/sub replaces client polling: writes publish a hint
+    # and clients refetch only when something actually changed
+    async def event_source():
+        pubsub = r.pubsub()
+        await pubsub.subscribe(channel)
+        try:
+            async for message in pubsub.listen():
+                if message["type"] != "message":
+                    continue
+                data = message["data"]
+                if isinstance(data, bytes):
+                    data = data.decode()
+                yield f"data: {data}\n\n"
+        finally:
+            await pubsub.unsubscribe(channel)
+            await pubsub.close()
+
+    return StreamingResponse(event_source(), media_type="text/event-stream")
 
 
 @router.put("/{notification_id}/read", response_model=NotificationResponse)
 async def mark_notification_read(
     notification_id: str,
     db: AsyncSession = Depends(get_db),
+    r = Depends(get_redis),
     current_user: User = Depends(get_current_user)
 ):
     result = await db.execute(
@@ -55,50 +176,68 @@ async def mark_notification_read(
     notification.read = True
     await db.commit()
     await db.refresh(notification)
-    
+
+    await cache_invalidate(r, f"notif:{current_user.id}:*")
+    await r.publish(
+        f"notifications:{current_user.id}",
+        orjson.dumps({"event": "read", "id": str(notification.id)})
+    )
     return notification
 
 
 @router.put("/mark-all-read")
 async def mark_all_notifications_read(
     db: AsyncSession = Depends(get_db),
+    r = Depends(get_redis),
     current_user: User = Depends(get_current_user)
 ):
     result = await db.execute(
-        select(Notification).where(
+        update(Notification)
+        .where(
             Notification.user_id == current_user.id,
             Notification.read == False
         )
+        .values(read=True)
+        .execution_options(synchronize_session=False)
     )
-    notifications = result.scalars().all()
-    
-    for notification in notifications:
-        notification.read = True
-    
+
     await db.commit()
-    return {"message": f"Marked {len(notifications)} notifications as read"}
+
+    await cache_invalidate(r, f"notif:{current_user.id}:*")
+    await r.publish(
+        f"notifications:{current_user.id}",
+        orjson.dumps({"event": "read_all", "count": result.rowcount})
+    )
+    return {"message": f"Marked {result.rowcount} notifications as read"}
 
 
 @router.delete("/{notification_id}")
 async def delete_notification(
     notification_id: str,
     db: AsyncSession = Depends(get_db),
+    r = Depends(get_redis),
     current_user: User = Depends(get_current_user)
 ):
     result = await db.execute(
-        select(Notification).where(
+        delete(Notification)
+        .where(
             Notification.id == notification_id,
             Notification.user_id == current_user.id
         )
+        .returning(Notification.id)
     )
-    notification = result.scalar_one_or_none()
-    
-    if not notification:
+
+    if result.first() is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Notification not found"
         )
-    
-    await db.delete(notification)
+
     await db.commit()
+
+    await cache_invalidate(r, f"notif:{current_user.id}:*")
+    await r.publish(
+        f"notifications:{current_user.id}",
+        orjson.dumps({"event": "deleted", "id": notification_id})
+    )
     return {"message": "Notification deleted successfully"}
\ No newline at end of file
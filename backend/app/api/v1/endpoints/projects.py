@@ -1,25 +1,47 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from sqlalchemy.orm import selectinload
-from typing import List
+from sqlalchemy import delete, lambda_stmt, select, tuple_, update
+from sqlalchemy.orm import selectinload, raiseload
+from typing import Optional
 
+from app.core.cache import get_redis, cache_get, cache_set, cache_invalidate
 from app.core.database import get_db
-from app.models.user import User
+from app.core.pagination import decode_cursor, next_cursor_from
+from app.models.user import User, Role
 from app.models.project import Project
-from app.schemas.project import ProjectCreate, ProjectUpdate, ProjectResponse
+from app.models.task import Task
+from app.schemas.project import ProjectCreate, ProjectUpdate, ProjectResponse, ProjectListItem, ProjectListResponse
 from app.api.v1.endpoints.auth import get_current_user
 
 router = APIRouter()
 
+# Exactly the columns ProjectListItem serializes; list queries project
+# these instead of hydrating tracked ORM instances, and skip the
+# description Text column entirely (the detail endpoint carries it)
+PROJECT_LIST_COLS = (
+    Project.id,
+    Project.client_id,
+    Project.title,
+    Project.tags,
+    Project.budget,
+    Project.status,
+    Project.created_at,
+    Project.updated_at,
+)
+
+# Module-level adapter so Pydantic's Rust serializer is built once, not per request
+PROJECT_PAGE_ADAPTER = TypeAdapter(ProjectListResponse)
+
 
 @router.post("/", response_model=ProjectResponse)
 async def create_project(
     project_data: ProjectCreate,
     db: AsyncSession = Depends(get_db),
+    r = Depends(get_redis),
     current_user: User = Depends(get_current_user)
 ):
-    if current_user.role != "client":
+    if current_user.role != Role.CLIENT:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Only clients can create projects"
@@ -27,42 +49,58 @@ async def create_project(
     
     db_project = Project(
         client_id=current_user.id,
-        **project_data.dict()
+        **project_data.model_dump()
     )
     
     db.add(db_project)
     await db.commit()
     await db.refresh(db_project)
-    
+
+    # Open project lists are shared across workers, so drop the whole namespace
+    await cache_invalidate(r, "proj:*")
     return db_project
 
 
-@router.get("/", response_model=List[ProjectResponse])
+@router.get("/", response_model=ProjectListResponse)
 async def get_projects(
-    skip: int = 0,
+    cursor: Optional[str] = None,
     limit: int = 100,
     db: AsyncSession = Depends(get_db),
+    r = Depends(get_redis),
     current_user: User = Depends(get_current_user)
 ):
-    if current_user.role == "client":
+    cache_key = f"proj:{current_user.id}:{cursor}:{limit}"
+    cached = await cache_get(r, cache_key)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+
+    # lambda_stmt caches the compiled SQL keyed by the lambda chain, so
+    # repeat requests skip statement compilation entirely
+    user_id = current_user.id
+    query = lambda_stmt(lambda: select(*PROJECT_LIST_COLS))
+
+    if current_user.role == Role.CLIENT:
         # Clients see only their projects
-        result = await db.execute(
-            select(Project)
-            .where(Project.client_id == current_user.id)
-            .offset(skip)
-            .limit(limit)
-        )
+        query += lambda s: s.where(Project.client_id == user_id)
     else:
         # Workers see open projects
-        result = await db.execute(
-            select(Project)
-            .where(Project.status == "open")
-            .offset(skip)
-            .limit(limit)
-        )
-    
-    projects = result.scalars().all()
-    return projects
+        query += lambda s: s.where(Project.status == "open")
+
+    if cursor:
+        ts, id_ = decode_cursor(cursor)
+        query += lambda s: s.where(tuple_(Project.created_at, Project.id) < tuple_(ts, id_))
+
+    query += lambda s: s.order_by(Project.created_at.desc(), Project.id.desc()).limit(limit)
+    result = await db.execute(query)
+    projects = result.all()
+
+    page = ProjectListResponse(
+        items=[ProjectListItem.model_validate(dict(p._mapping)) for p in projects],
+        next_cursor=next_cursor_from(projects, limit)
+    )
+    body = PROJECT_PAGE_ADAPTER.dump_json(page)
+    await cache_set(r, cache_key, body)
+    return Response(content=body, media_type="application/json")
 
 
 @router.get("/{project_id}", response_model=ProjectResponse)
@@ -71,26 +109,25 @@ async def get_project(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    result = await db.execute(
+    # The permission check lives in the WHERE clause: unauthorized rows are
+    # never fetched and a miss reads uniformly as 404
+    query = (
         select(Project)
-        .options(selectinload(Project.tasks))
+        .options(selectinload(Project.tasks), raiseload("*"))
         .where(Project.id == project_id)
     )
+    if current_user.role == Role.CLIENT:
+        query = query.where(Project.client_id == current_user.id)
+
+    result = await db.execute(query)
     project = result.scalar_one_or_none()
-    
+
     if not project:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Project not found"
         )
-    
-    # Check permissions
-    if current_user.role == "client" and project.client_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to view this project"
-        )
-    
+
     return project
 
 
@@ -99,29 +136,41 @@ async def update_project(
     project_id: str,
     project_update: ProjectUpdate,
     db: AsyncSession = Depends(get_db),
+    r = Depends(get_redis),
     current_user: User = Depends(get_current_user)
 ):
-    result = await db.execute(select(Project).where(Project.id == project_id))
+    update_data = project_update.model_dump(exclude_unset=True)
+
+    if update_data:
+        # Authorize, update and read back the fresh row in one statement —
+        # no setattr loop, no flush, no refresh SELECT
+        result = await db.execute(
+            update(Project)
+            .where(
+                Project.id == project_id,
+                Project.client_id == current_user.id
+            )
+            .values(**update_data)
+            .returning(Project)
+        )
+    else:
+        result = await db.execute(
+            select(Project).where(
+                Project.id == project_id,
+                Project.client_id == current_user.id
+            )
+        )
     project = result.scalar_one_or_none()
-    
+
     if not project:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Project not found"
         )
-    
-    if project.client_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to update this project"
-        )
-    
-    update_data = project_update.dict(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(project, field, value)
-    
+
     await db.commit()
-    await db.refresh(project)
+
+    await cache_invalidate(r, "proj:*")
     return project
 
 
@@ -129,23 +178,37 @@ async def update_project(
 async def delete_project(
     project_id: str,
     db: AsyncSession = Depends(get_db),
+    r = Depends(get_redis),
     current_user: User = Depends(get_current_user)
 ):
-    result = await db.execute(select(Project).where(Project.id == project_id))
-    project = result.scalar_one_or_none()
-    
-    if not project:
+    # Core DELETE bypasses the ORM cascade, so remove the project's tasks
+    # in the same transaction before deleting the project itself
+    await db.execute(
+        delete(Task).where(
+            Task.project_id.in_(
+                select(Project.id).where(
+                    Project.id == project_id,
+                    Project.client_id == current_user.id
+                )
+            )
+        )
+    )
+    result = await db.execute(
+        delete(Project)
+        .where(
+            Project.id == project_id,
+            Project.client_id == current_user.id
+        )
+        .returning(Project.id)
+    )
+
+    if result.first() is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Project not found"
         )
-    
-    if project.client_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to delete this project"
-        )
-    
-    await db.delete(project)
+
     await db.commit()
+
+    await cache_invalidate(r, "proj:*")
     return {"message": "Project deleted successfully"}
\ No newline at end of file
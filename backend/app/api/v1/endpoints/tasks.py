@@ -1,18 +1,78 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_
-from sqlalchemy.orm import selectinload
-from typing import List
+from sqlalchemy import delete, insert, lambda_stmt, literal, select, tuple_, update, and_, or_
+from sqlalchemy.orm import selectinload, raiseload
+from typing import List, Optional
 
 from app.core.database import get_db
-from app.models.user import User
+from app.core.pagination import decode_cursor, next_cursor_from
+from app.models.user import User, Role
 from app.models.project import Project
 from app.models.task import Task
-from app.schemas.task import TaskCreate, TaskUpdate, TaskResponse
+from app.schemas.task import TaskCreate, TaskUpdate, TaskResponse, TaskListItem, TaskListResponse
 from app.api.v1.endpoints.auth import get_current_user
 
 router = APIRouter()
 
+# Exactly the columns TaskListItem serializes; list queries project
+# these instead of hydrating tracked ORM instances, and skip the
+# description Text column entirely. The stream route adds it back
+# for full exports.
+TASK_LIST_COLS = (
+    Task.id,
+    Task.project_id,
+    Task.title,
+    Task.weight,
+    Task.assignee_id,
+    Task.status,
+    Task.payout,
+    Task.deadline,
+    Task.pricing_type,
+    Task.hourly_rate,
+    Task.estimated_hours,
+    Task.required_skills,
+    Task.auto_assign,
+    Task.application_window_minutes,
+    Task.created_at,
+    Task.updated_at,
+)
+TASK_FULL_COLS = TASK_LIST_COLS + (Task.description,)
+
+# Module-level adapters so Pydantic's Rust serializer is built once, not per request
+TASK_PAGE_ADAPTER = TypeAdapter(TaskListResponse)
+TASK_LIST_ADAPTER = TypeAdapter(List[TaskResponse])
+
+
+def _client_task_filter(query, user_id):
+    # Clients see tasks from their projects; an explicit join keeps the
+    # plan to a single indexed join instead of a materialized subplan
+    query += lambda s: s.join(
+        Project, Project.id == Task.project_id
+    ).where(Project.client_id == user_id)
+    return query
+
+
+def _worker_task_filter(query, user_id):
+    # Workers see open tasks or their assigned tasks
+    query += lambda s: s.where(
+        and_(
+            Task.status == "open",
+            Task.assignee_id.is_(None)
+        )
+    )
+    return query
+
+
+# Role-keyed dispatch replaces the string-compare chain on the hot path
+TASK_ROLE_FILTERS = {
+    Role.CLIENT: _client_task_filter,
+    Role.WORKER: _worker_task_filter,
+}
+
 
 @router.post("/", response_model=TaskResponse)
 async def create_task(
@@ -20,83 +80,208 @@ async def create_task(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    # Verify project ownership
-    result = await db.execute(select(Project).where(Project.id == task_data.project_id))
-    project = result.scalar_one_or_none()
-    
-    if not project:
+    # INSERT ... FROM SELECT verifies project ownership and inserts the task
+    # in one statement; the SELECT matches no rows unless the project exists
+    # and belongs to the current user
+    values = task_data.model_dump()
+    values.pop("project_id")
+    field_names = list(values)
+
+    ownership_select = select(
+        Project.id,
+        *[literal(values[f], type_=Task.__table__.c[f].type) for f in field_names]
+    ).where(
+        Project.id == task_data.project_id,
+        Project.client_id == current_user.id
+    )
+
+    result = await db.execute(
+        insert(Task)
+        .from_select(["project_id"] + field_names, ownership_select)
+        .returning(Task)
+    )
+    task = result.scalar_one_or_none()
+
+    if task is None:
+        exists = await db.execute(
+            select(Project.id).where(Project.id == task_data.project_id)
+        )
+        if exists.first() is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Project not found"
+            )
         raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Project not found"
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not authorized to create tasks for this project"
         )
-    
-    if project.client_id != current_user.id:
+
+    await db.commit()
+    return task
+
+
+@router.post("/bulk", response_model=List[TaskResponse])
+async def create_tasks_bulk(
+    tasks_data: List[TaskCreate],
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    if not tasks_data:
+        return Response(content=TASK_LIST_ADAPTER.dump_json([]), media_type="application/json")
+
+    # One ownership SELECT for the whole batch, then one multi-row INSERT —
+    # N round trips collapse to two regardless of batch size
+    project_ids = {t.project_id for t in tasks_data}
+    result = await db.execute(
+        select(Project.id).where(
+            Project.id.in_(project_ids),
+            Project.client_id == current_user.id
+        )
+    )
+    owned = {row[0] for row in result}
+
+    if owned != project_ids:
+        # Mirror the single-task path: one probe on the error path decides
+        # whether the unmatched ids are missing (404) or foreign (403)
+        missing = project_ids - owned
+        result = await db.execute(
+            select(Project.id).where(Project.id.in_(missing))
+        )
+        existing = {row[0] for row in result}
+        if existing != missing:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Project not found"
+            )
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not authorized to create tasks for this project"
         )
-    
-    db_task = Task(**task_data.dict())
-    db.add(db_task)
+
+    result = await db.execute(
+        insert(Task)
+        .values([t.model_dump() for t in tasks_data])
+        .returning(Task)
+    )
+    tasks = result.scalars().all()
     await db.commit()
-    await db.refresh(db_task)
-    
-    return db_task
 
+    items = [TaskResponse.model_validate(t) for t in tasks]
+    return Response(content=TASK_LIST_ADAPTER.dump_json(items), media_type="application/json")
 
-@router.get("/", response_model=List[TaskResponse])
+
+@router.get("/", response_model=TaskListResponse)
 async def get_tasks(
     project_id: str = None,
     status: str = None,
-    skip: int = 0,
+    cursor: Optional[str] = None,
     limit: int = 100,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    query = select(Task)
-    
-    if current_user.role == "client":
-        # Clients see tasks from their projects
-        client_projects = select(Project.id).where(Project.client_id == current_user.id)
-        query = query.where(Task.project_id.in_(client_projects))
-    elif current_user.role == "worker":
-        # Workers see open tasks or their assigned tasks
+    # lambda_stmt caches the compiled SQL keyed by the lambda chain, so
+    # repeat requests skip statement compilation entirely
+    user_id = current_user.id
+    task_status = status
+    query = lambda_stmt(lambda: select(*TASK_LIST_COLS))
+
+    role_filter = TASK_ROLE_FILTERS.get(current_user.role)
+    if role_filter:
+        query = role_filter(query, user_id)
+
+    if project_id:
+        query += lambda s: s.where(Task.project_id == project_id)
+
+    if task_status:
+        query += lambda s: s.where(Task.status == task_status)
+
+    if cursor:
+        ts, id_ = decode_cursor(cursor)
+        query += lambda s: s.where(tuple_(Task.created_at, Task.id) < tuple_(ts, id_))
+
+    query += lambda s: s.order_by(Task.created_at.desc(), Task.id.desc()).limit(limit)
+    result = await db.execute(query)
+    tasks = result.all()
+
+    page = TaskListResponse(
+        items=[TaskListItem.model_validate(dict(t._mapping)) for t in tasks],
+        next_cursor=next_cursor_from(tasks, limit)
+    )
+    return Response(content=TASK_PAGE_ADAPTER.dump_json(page), media_type="application/json")
+
+
+@router.get("/stream")
+async def stream_tasks(
+    project_id: str = None,
+    status: str = None,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    query = select(*TASK_FULL_COLS)
+
+    if current_user.role == Role.CLIENT:
+        query = query.join(
+            Project, Project.id == Task.project_id
+        ).where(Project.client_id == current_user.id)
+    elif current_user.role == Role.WORKER:
         query = query.where(
             and_(
                 Task.status == "open",
                 Task.assignee_id.is_(None)
             )
         )
-    
+
     if project_id:
         query = query.where(Task.project_id == project_id)
-    
+
     if status:
         query = query.where(Task.status == status)
-    
-    query = query.offset(skip).limit(limit)
-    result = await db.execute(query)
-    tasks = result.scalars().all()
-    
-    return tasks
 
+    query = query.order_by(Task.created_at.desc(), Task.id.desc())
+
+    # Server-side streaming keeps memory at O(partition) instead of O(result)
+    # and starts the response before the full set is fetched
+    async def generate():
+        result = await db.stream(query)
+        async for partition in result.partitions(500):
+            for row in partition:
+                item = TaskResponse.model_validate(dict(row._mapping))
+                yield orjson.dumps(jsonable_encoder(item)) + b"\n"
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
 
-@router.get("/my-tasks", response_model=List[TaskResponse])
+
+@router.get("/my-tasks", response_model=TaskListResponse)
 async def get_my_tasks(
+    cursor: Optional[str] = None,
+    limit: int = 50,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    if current_user.role != "worker":
+    if current_user.role != Role.WORKER:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Only workers can view assigned tasks"
         )
-    
-    result = await db.execute(
-        select(Task).where(Task.assignee_id == current_user.id)
+
+    # Most recently touched first, bounded and keyset-paginated like the
+    # other list endpoints but keyed on (updated_at, id)
+    user_id = current_user.id
+    query = lambda_stmt(lambda: select(*TASK_LIST_COLS).where(Task.assignee_id == user_id))
+
+    if cursor:
+        ts, id_ = decode_cursor(cursor)
+        query += lambda s: s.where(tuple_(Task.updated_at, Task.id) < tuple_(ts, id_))
+
+    query += lambda s: s.order_by(Task.updated_at.desc(), Task.id.desc()).limit(limit)
+    result = await db.execute(query)
+    tasks = result.all()
+
+    page = TaskListResponse(
+        items=[TaskListItem.model_validate(dict(t._mapping)) for t in tasks],
+        next_cursor=next_cursor_from(tasks, limit, field="updated_at")
     )
-    tasks = result.scalars().all()
-    return tasks
+    return Response(content=TASK_PAGE_ADAPTER.dump_json(page), media_type="application/json")
 
 
 @router.get("/{task_id}", response_model=TaskResponse)
@@ -105,27 +290,31 @@ async def get_task(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    result = await db.execute(
+    # The permission check lives in the WHERE clause: unauthorized rows are
+    # never fetched and a miss reads uniformly as 404
+    query = (
         select(Task)
-        .options(selectinload(Task.project))
+        .options(selectinload(Task.project), raiseload("*"))
         .where(Task.id == task_id)
     )
+    if current_user.role == Role.CLIENT:
+        query = query.where(
+            Task.project_id.in_(select(Project.id).where(Project.client_id == current_user.id))
+        )
+    elif current_user.role == Role.WORKER:
+        query = query.where(
+            or_(Task.assignee_id == current_user.id, Task.status == "open")
+        )
+
+    result = await db.execute(query)
     task = result.scalar_one_or_none()
-    
+
     if not task:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Task not found"
         )
-    
-    # Check permissions
-    if (current_user.role == "client" and task.project.client_id != current_user.id) or \
-       (current_user.role == "worker" and task.assignee_id != current_user.id and task.status != "open"):
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to view this task"
-        )
-    
+
     return task
 
 
@@ -136,37 +325,33 @@ async def update_task(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    result = await db.execute(
-        select(Task)
-        .options(selectinload(Task.project))
-        .where(Task.id == task_id)
-    )
+    filters = [Task.id == task_id]
+    if current_user.role == Role.CLIENT:
+        filters.append(
+            Task.project_id.in_(select(Project.id).where(Project.client_id == current_user.id))
+        )
+    elif current_user.role == Role.WORKER:
+        filters.append(Task.assignee_id == current_user.id)
+
+    update_data = task_update.model_dump(exclude_unset=True)
+
+    if update_data:
+        # Authorize, update and read back the fresh row in one statement —
+        # no setattr loop, no flush, no refresh SELECT
+        result = await db.execute(
+            update(Task).where(*filters).values(**update_data).returning(Task)
+        )
+    else:
+        result = await db.execute(select(Task).where(*filters))
     task = result.scalar_one_or_none()
-    
+
     if not task:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Task not found"
         )
-    
-    # Check permissions
-    if current_user.role == "client" and task.project.client_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to update this task"
-        )
-    elif current_user.role == "worker" and task.assignee_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to update this task"
-        )
-    
-    update_data = task_update.dict(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(task, field, value)
-    
+
     await db.commit()
-    await db.refresh(task)
     return task
 
 
@@ -176,32 +361,39 @@ async def claim_task(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    if current_user.role != "worker":
+    if current_user.role != Role.WORKER:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Only workers can claim tasks"
         )
     
-    result = await db.execute(select(Task).where(Task.id == task_id))
-    task = result.scalar_one_or_none()
-    
-    if not task:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Task not found"
+    # Conditional UPDATE claims the task atomically: two workers racing on
+    # the same task can never both match status='open' AND assignee IS NULL
+    result = await db.execute(
+        update(Task)
+        .where(
+            Task.id == task_id,
+            Task.status == "open",
+            Task.assignee_id.is_(None)
         )
-    
-    if task.status != "open" or task.assignee_id is not None:
+        .values(assignee_id=current_user.id, status="assigned")
+        .returning(Task)
+    )
+    task = result.scalar_one_or_none()
+
+    if task is None:
+        exists = await db.execute(select(Task.id).where(Task.id == task_id))
+        if exists.first() is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Task not found"
+            )
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Task is not available for claiming"
         )
-    
-    task.assignee_id = current_user.id
-    task.status = "assigned"
-    
+
     await db.commit()
-    await db.refresh(task)
     return task
 
 
@@ -212,24 +404,21 @@ async def delete_task(
     current_user: User = Depends(get_current_user)
 ):
     result = await db.execute(
-        select(Task)
-        .options(selectinload(Task.project))
-        .where(Task.id == task_id)
+        delete(Task)
+        .where(
+            Task.id == task_id,
+            Task.project_id.in_(
+                select(Project.id).where(Project.client_id == current_user.id)
+            )
+        )
+        .returning(Task.id)
     )
-    task = result.scalar_one_or_none()
-    
-    if not task:
+
+    if result.first() is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Task not found"
         )
-    
-    if task.project.client_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to delete this task"
-        )
-    
-    await db.delete(task)
+
     await db.commit()
     return {"message": "Task deleted successfully"}
\ No newline at end of file
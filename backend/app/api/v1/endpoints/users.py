@@ -3,6 +3,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from typing import List
 
+from app.core.cache import get_redis
 from app.core.database import get_db
 from app.models.user import User
 from app.schemas.user import UserResponse, UserUpdate
@@ -43,23 +44,29 @@ async def get_user(
 async def update_current_user(
     user_update: UserUpdate,
     db: AsyncSession = Depends(get_db),
+    r = Depends(get_redis),
     current_user: User = Depends(get_current_user)
 ):
-    update_data = user_update.dict(exclude_unset=True)
-    
+    update_data = user_update.model_dump(exclude_unset=True)
+
     for field, value in update_data.items():
         setattr(current_user, field, value)
-    
+
     await db.commit()
     await db.refresh(current_user)
+
+    await r.delete(f"user:{current_user.email}")
     return current_user
 
 
 @router.delete("/me")
 async def delete_current_user(
     db: AsyncSession = Depends(get_db),
+    r = Depends(get_redis),
     current_user: User = Depends(get_current_user)
 ):
     current_user.is_active = False
     await db.commit()
+
+    await r.delete(f"user:{current_user.email}")
     return {"message": "User account deactivated"}
\ No newline at end of file
@@ -0,0 +1,22 @@
+import redis.asyncio as aioredis
+from app.core.config import settings
+
+redis_client = aioredis.from_url(settings.REDIS_URL)
+
+
+async def get_redis() -> aioredis.Redis:
+    return redis_client
+
+
+async def cache_get(r: aioredis.Redis, key: str):
+    # Values are pre-serialized JSON bytes, returned as-is for the response
+    return await r.get(key)
+
+
+async def cache_set(r: aioredis.Redis, key: str, body: bytes, ttl: int = 30):
+    await r.set(key, body, ex=ttl)
+
+
+async def cache_invalidate(r: aioredis.Redis, pattern: str):
+    async for key in r.scan_iter(match=pattern):
+        await r.delete(key)
@@ -10,7 +10,18 @@ if database_url.startswith("postgresql://"):
 engine = create_async_engine(
     database_url,
     echo=True,  # Set to False in production
-    future=True
+    future=True,
+    # Under load the optimized endpoints bottleneck on checkout, not queries;
+    # size the pool explicitly and fail fast instead of queueing forever
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_pre_ping=True,
+    # asyncpg prepared-statement cache; pairs with lambda_stmt so the small
+    # set of statement templates gets plan reuse end to end
+    connect_args={
+        "prepared_statement_cache_size": settings.DB_PREPARED_STATEMENT_CACHE_SIZE,
+    },
 )
 
 AsyncSessionLocal = async_sessionmaker(
@@ -0,0 +1,32 @@
+import base64
+import binascii
+import uuid
+from datetime import datetime
+from typing import Optional, Tuple
+from fastapi import HTTPException, status
+
+
+def encode_cursor(created_at: datetime, id_) -> str:
+    raw = f"{created_at.isoformat()}|{id_}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, uuid.UUID]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        ts, id_ = raw.split("|", 1)
+        # The id must bind as UUID: tuple comparisons don't inherit the
+        # left-hand column types, and Postgres has no uuid < varchar operator
+        return datetime.fromisoformat(ts), uuid.UUID(id_)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+
+def next_cursor_from(rows, limit: int, field: str = "created_at") -> Optional[str]:
+    if not rows or len(rows) < limit:
+        return None
+    last = rows[-1]
+    return encode_cursor(getattr(last, field), last.id)
@@ -1,6 +1,6 @@
-from .user import User
+from .user import User, Role
 from .project import Project
 from .task import Task
 from .notification import Notification
 
-__all__ = ["User", "Project", "Task", "Notification"]
\ No newline at end of file
+__all__ = ["User", "Role", "Project", "Task", "Notification"]
\ No newline at end of file
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, DateTime, Text, ForeignKey, Boolean
+from sqlalchemy import Column, String, DateTime, Text, ForeignKey, Boolean, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
@@ -21,6 +21,15 @@ class Notification(Base):
     # Relationships
     user = relationship("User", back_populates="notifications")
 
+    # Back keyset pagination and the unread_only filter in GET /notifications
+    __table_args__ = (
+        Index("ix_notifications_user_created", user_id, created_at.desc(), id.desc()),
+        Index(
+            "ix_notifications_user_unread_created", user_id, created_at.desc(), id.desc(),
+            postgresql_where=(read == False)
+        ),
+    )
+
 
 # Add relationship to User model
 from app.models.user import User
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Float, DateTime, Text, ARRAY, ForeignKey
+from sqlalchemy import Column, String, Float, DateTime, Text, ARRAY, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
@@ -23,6 +23,12 @@ class Project(Base):
     client = relationship("User", back_populates="projects")
     tasks = relationship("Task", back_populates="project", cascade="all, delete-orphan")
 
+    # Back keyset pagination in GET /projects (client and worker branches)
+    __table_args__ = (
+        Index("ix_projects_client_created", client_id, created_at.desc(), id.desc()),
+        Index("ix_projects_status_created", status, created_at.desc(), id.desc()),
+    )
+
 
 # Add relationship to User model
 from app.models.user import User
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Float, Integer, DateTime, Text, ARRAY, ForeignKey, Boolean
+from sqlalchemy import Column, String, Float, Integer, DateTime, Text, ARRAY, ForeignKey, Boolean, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
@@ -31,6 +31,21 @@ class Task(Base):
     project = relationship("Project", back_populates="tasks")
     assignee = relationship("User", foreign_keys=[assignee_id])
 
+    # Back keyset pagination, the project/status filters, assignee lookups
+    # and the atomic claim UPDATE in the task endpoints
+    __table_args__ = (
+        Index("ix_tasks_project_created", project_id, created_at.desc(), id.desc()),
+        Index("ix_tasks_project_status", project_id, status),
+        Index(
+            "ix_tasks_assignee_updated", assignee_id, updated_at.desc(), id.desc(),
+            postgresql_include=["status", "title", "payout"]
+        ),
+        Index(
+            "ix_tasks_open_unassigned", id,
+            postgresql_where=(status == "open") & assignee_id.is_(None)
+        ),
+    )
+
 
 # Add relationship to User model
 from app.models.user import User
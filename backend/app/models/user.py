@@ -1,3 +1,4 @@
+import enum
 from sqlalchemy import Column, String, Float, Integer, Boolean, DateTime, ARRAY, Text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
@@ -5,6 +6,11 @@ import uuid
 from app.core.database import Base
 
 
+class Role(str, enum.Enum):
+    CLIENT = "client"
+    WORKER = "worker"
+
+
 class User(Base):
     __tablename__ = "users"
 
@@ -1,13 +1,13 @@
 from .user import UserCreate, UserUpdate, UserResponse, UserLogin
-from .project import ProjectCreate, ProjectUpdate, ProjectResponse
-from .task import TaskCreate, TaskUpdate, TaskResponse
-from .notification import NotificationResponse
+from .project import ProjectCreate, ProjectUpdate, ProjectResponse, ProjectListItem, ProjectListResponse
+from .task import TaskCreate, TaskUpdate, TaskResponse, TaskListItem, TaskListResponse
+from .notification import NotificationResponse, NotificationListItem, NotificationListResponse
 from .token import Token, TokenData
 
 __all__ = [
     "UserCreate", "UserUpdate", "UserResponse", "UserLogin",
-    "ProjectCreate", "ProjectUpdate", "ProjectResponse",
-    "TaskCreate", "TaskUpdate", "TaskResponse",
-    "NotificationResponse",
+    "ProjectCreate", "ProjectUpdate", "ProjectResponse", "ProjectListItem", "ProjectListResponse",
+    "TaskCreate", "TaskUpdate", "TaskResponse", "TaskListItem", "TaskListResponse",
+    "NotificationResponse", "NotificationListItem", "NotificationListResponse",
     "Token", "TokenData"
 ]
\ No newline at end of file
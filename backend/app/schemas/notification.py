@@ -1,4 +1,5 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
+from typing import Optional, List
 from datetime import datetime
 import uuid
 
@@ -13,5 +14,22 @@ class NotificationResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True)
+
+
+class NotificationListItem(BaseModel):
+    # List view omits the message Text column; fetch it via the stream route
+    id: uuid.UUID
+    user_id: uuid.UUID
+    title: str
+    type: str
+    read: bool
+    created_at: datetime
+    updated_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class NotificationListResponse(BaseModel):
+    items: List[NotificationListItem]
+    next_cursor: Optional[str] = None
\ No newline at end of file
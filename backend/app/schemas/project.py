@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import Optional, List
 from datetime import datetime
 import uuid
@@ -30,5 +30,23 @@ class ProjectResponse(ProjectBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True)
+
+
+class ProjectListItem(BaseModel):
+    # List view omits the description Text column; the detail endpoint has it
+    id: uuid.UUID
+    client_id: uuid.UUID
+    title: str
+    tags: Optional[List[str]] = []
+    budget: float
+    status: str
+    created_at: datetime
+    updated_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class ProjectListResponse(BaseModel):
+    items: List[ProjectListItem]
+    next_cursor: Optional[str] = None
\ No newline at end of file
@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import Optional, List
 from datetime import datetime
 import uuid
@@ -45,5 +45,31 @@ class TaskResponse(TaskBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True)
+
+
+class TaskListItem(BaseModel):
+    # List view omits the description Text column; the detail endpoint has it
+    id: uuid.UUID
+    project_id: uuid.UUID
+    title: str
+    weight: int = 1
+    assignee_id: Optional[uuid.UUID] = None
+    status: str
+    payout: float
+    deadline: Optional[datetime] = None
+    pricing_type: str = "fixed"
+    hourly_rate: Optional[float] = None
+    estimated_hours: Optional[int] = None
+    required_skills: Optional[List[str]] = []
+    auto_assign: bool = False
+    application_window_minutes: int = 60
+    created_at: datetime
+    updated_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class TaskListResponse(BaseModel):
+    items: List[TaskListItem]
+    next_cursor: Optional[str] = None
\ No newline at end of file